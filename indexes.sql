@@ -0,0 +1,21 @@
+-- SkyMentor database indexes
+-- Built by db_setup.py after seed data is loaded, so each index is created
+-- in one pass over the populated table
+
+CREATE INDEX idx_users_role ON users(role);
+CREATE INDEX idx_availability_user_id ON availability(user_id);
+CREATE INDEX idx_availability_day_role ON availability(day_of_week, role);
+CREATE INDEX idx_session_blocks_mentor_date ON session_blocks(mentor_id, date);
+CREATE INDEX idx_attendance_requests_session ON attendance_requests(session_block_id);
+CREATE INDEX idx_attendance_requests_mentee ON attendance_requests(mentee_id, created_at DESC);
+CREATE INDEX idx_assignments_session ON assignments(session_block_id);
+CREATE INDEX idx_assignments_mentor ON assignments(mentor_id, created_at DESC);
+CREATE INDEX idx_assignments_mentee ON assignments(mentee_id, created_at DESC);
+CREATE INDEX idx_step_completions_mentee ON step_completions(mentee_id);
+CREATE INDEX idx_step_completions_step ON step_completions(step_id);
+CREATE INDEX idx_progression_steps_category ON progression_steps(category);
+CREATE INDEX idx_awards_mentee ON awards(mentee_id);
+CREATE INDEX idx_jump_logs_mentee ON jump_logs(mentee_id);
+CREATE INDEX idx_jump_logs_mentor ON jump_logs(mentor_id);
+CREATE INDEX idx_audit_events_actor ON audit_events(actor_id);
+CREATE INDEX idx_audit_events_type_at ON audit_events(type, at);
@@ -0,0 +1,164 @@
+-- SkyMentor database schema
+-- Loaded by db_setup.py in a single execute inside one transaction
+
+-- Enums
+CREATE TYPE role AS ENUM ('mentor', 'mentee', 'admin');
+CREATE TYPE status AS ENUM ('pending', 'confirmed', 'declined', 'cancelled');
+CREATE TYPE comfort_level AS ENUM ('low', 'medium', 'high');
+CREATE TYPE category AS ENUM ('2way', '3way', '4way', 'canopy', 'safety');
+
+-- Users table (main account table)
+CREATE TABLE users (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    role role NOT NULL,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL UNIQUE,
+    phone TEXT,
+    uspa_license TEXT,
+    jumps INTEGER DEFAULT 0,
+    is_active BOOLEAN DEFAULT true,
+    password_hash TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Mentors table (extended profile for mentors)
+-- Profile tables share the users primary key, so profile lookups join on two
+-- PK indexes. Keep them in step with shared/schema.ts, which the app queries.
+CREATE TABLE mentors (
+    id UUID PRIMARY KEY REFERENCES users(id),
+    ratings TEXT,
+    coach_number TEXT,
+    disciplines JSONB DEFAULT '[]',
+    max_concurrent_mentees INTEGER DEFAULT 2,
+    seniority_score INTEGER DEFAULT 0,
+    dz_endorsement BOOLEAN DEFAULT false
+);
+
+-- Mentees table (extended profile for mentees)
+CREATE TABLE mentees (
+    id UUID PRIMARY KEY REFERENCES users(id),
+    goals TEXT,
+    comfort_level comfort_level DEFAULT 'medium',
+    canopy_size INTEGER,
+    last_currency_date DATE
+);
+
+-- Availability table (when users are available)
+CREATE TABLE availability (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    user_id UUID REFERENCES users(id) NOT NULL,
+    role role NOT NULL,
+    day_of_week INTEGER NOT NULL, -- 0-6 (Sunday-Saturday)
+    start_time TIME NOT NULL,
+    end_time TIME NOT NULL,
+    start_date DATE,
+    end_date DATE,
+    is_recurring BOOLEAN DEFAULT true,
+    capacity_override INTEGER
+);
+
+-- Session blocks table (training sessions created by mentors)
+CREATE TABLE session_blocks (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    mentor_id UUID REFERENCES mentors(id) NOT NULL,
+    date DATE NOT NULL,
+    start_time TIME NOT NULL,
+    end_time TIME NOT NULL,
+    dz_id UUID,
+    load_interval_min INTEGER DEFAULT 90,
+    block_capacity_hint INTEGER DEFAULT 8
+);
+
+-- Attendance requests table (mentees request to join sessions)
+-- Status changes often, so leave page space for HOT updates
+CREATE TABLE attendance_requests (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    mentee_id UUID REFERENCES mentees(id) NOT NULL,
+    session_block_id UUID REFERENCES session_blocks(id) NOT NULL,
+    status status DEFAULT 'pending',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+) WITH (fillfactor = 90);
+
+-- Preferences table (mentee matching preferences)
+CREATE TABLE preferences (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    mentee_id UUID REFERENCES mentees(id) NOT NULL,
+    preferred_mentors JSONB DEFAULT '[]',
+    avoid_mentors JSONB DEFAULT '[]',
+    notes TEXT
+);
+
+-- Assignments table (confirmed mentor-mentee pairings for sessions)
+-- Status changes often, so leave page space for HOT updates
+CREATE TABLE assignments (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    session_block_id UUID REFERENCES session_blocks(id) NOT NULL,
+    mentor_id UUID REFERENCES mentors(id) NOT NULL,
+    mentee_id UUID REFERENCES mentees(id) NOT NULL,
+    status status DEFAULT 'pending',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+) WITH (fillfactor = 90);
+
+-- Progression steps table (training milestones)
+CREATE TABLE progression_steps (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    code TEXT UNIQUE NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT,
+    category category NOT NULL,
+    required BOOLEAN DEFAULT true,
+    min_jumps_gate INTEGER DEFAULT 0,
+    references_json JSONB
+);
+
+-- Step completions table (record of completed training steps)
+CREATE TABLE step_completions (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    mentee_id UUID REFERENCES mentees(id) NOT NULL,
+    step_id UUID REFERENCES progression_steps(id) NOT NULL,
+    mentor_id UUID REFERENCES mentors(id) NOT NULL,
+    completed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    evidence_url TEXT,
+    notes TEXT
+);
+
+-- Badges table (available achievements)
+CREATE TABLE badges (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    code TEXT UNIQUE NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT,
+    criteria_json JSONB
+);
+
+-- Awards table (earned badges)
+CREATE TABLE awards (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    mentee_id UUID REFERENCES mentees(id) NOT NULL,
+    badge_id UUID REFERENCES badges(id) NOT NULL,
+    awarded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Jump logs table (detailed jump records)
+CREATE TABLE jump_logs (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    mentee_id UUID REFERENCES mentees(id) NOT NULL,
+    date DATE NOT NULL,
+    jump_number INTEGER NOT NULL,
+    aircraft TEXT,
+    exit_alt INTEGER,
+    freefall_time INTEGER,
+    deployment_alt INTEGER,
+    pattern_notes TEXT,
+    drill_ref TEXT,
+    mentor_id UUID REFERENCES mentors(id)
+);
+
+-- Audit events table (system activity tracking)
+CREATE TABLE audit_events (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    actor_id UUID REFERENCES users(id),
+    type TEXT NOT NULL,
+    payload_json JSONB,
+    at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);